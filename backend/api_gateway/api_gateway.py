@@ -24,7 +24,7 @@ Endpoints:
 """
 
 # Standard library imports
-from flask import Flask
+from flask import Flask, request, make_response
 from flask_cors import CORS
 from flask_restx import Api
 import sys
@@ -38,7 +38,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import microservices and utilities
+from backend.core.config import Config
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import OrjsonProvider, output_json
 
 from backend.api_gateway.routes.news import news_ns
 from backend.api_gateway.routes.auth import auth_ns
@@ -54,7 +56,8 @@ logger.info("API Gateway starting up...")
 
 # Initialize Flask application with security configurations
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # JWT secret key for token signing
+app.config['SECRET_KEY'] = Config.JWT_SECRET_KEY  # JWT secret key for token signing
+app.json = OrjsonProvider(app)  # Serialize JSON responses with orjson
 logger.info("Flask app initialized with security configurations")
 
 # Configure CORS to allow specific origins and methods
@@ -66,9 +69,28 @@ CORS(app,
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
 logger.info(f"CORS configured with allowed origins: {allowed_origins}")
 
+@app.before_request
+def _short_circuit_options():
+    """Answer CORS preflight requests before routing and authentication.
+
+    Preflights carry no body or credentials, so there is no reason to run
+    them through Flask-RestX dispatch or the token_required decorator.
+    """
+    if request.method == 'OPTIONS':
+        response = make_response('', 204)
+        origin = request.headers.get('Origin')
+        if origin in allowed_origins:
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.headers['Access-Control-Allow-Credentials'] = 'true'
+            response.headers['Vary'] = 'Origin'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
+        return response
+
 # Initialize Flask-RestX for API documentation
 api = Api(app, version='1.0', title='News Aggregator API',
           description='A news aggregation and summarization API')
+api.representations['application/json'] = output_json  # Resource responses use orjson too
 logger.info("Flask-RestX API initialized with documentation support")
 
 # Import namespaces from route modules
@@ -88,6 +110,9 @@ except Exception as e:
 
 logger.info("API Gateway initialization completed successfully")
 
+# In deployment the app is served by gunicorn with gevent workers
+# (see start-services.sh), which monkey-patch the standard library before
+# this module is imported. The block below runs Flask's development server.
 if __name__ == '__main__':
     try:
         # Read the port from the environment (Cloud Run sets the PORT variable)
@@ -8,16 +8,14 @@ This module contains the API routes for authentication operations including sign
 # Standard library imports
 from flask import jsonify, request, make_response
 from flask_restx import Resource, Namespace, fields
-import jwt
 import uuid
-import datetime
-import os
-import json
 from functools import wraps
 
 # Import microservices and utilities
-from backend.microservices.auth_service import load_users
+from backend.microservices.auth_service import add_user, get_user_by_username, hash_password, verify_password, MAX_PASSWORD_BYTES
+from backend.api_gateway.utils.auth import encode_token
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import json_body
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -46,7 +44,7 @@ class Signup(Resource):
         Expected JSON payload:
         {
             'username': str (required),
-            'password': str (required),
+            'password': str (required, at most 72 bytes),
             'email': str (required),
             'firstName': str (optional),
             'lastName': str (optional)
@@ -57,7 +55,7 @@ class Signup(Resource):
             int: HTTP 201 on success, 400 on validation error, 500 on server error.
         """
         logger.info("User signup endpoint called")
-        data = request.get_json()
+        data = json_body()
         username = data.get('username')
         password = data.get('password')
         email = data.get('email')
@@ -69,11 +67,12 @@ class Signup(Resource):
             logger.warning("Signup validation failed: missing required fields")
             return {'error': 'Username, password, and email are required'}, 400
 
-        users = load_users()
-        logger.debug(f"Loaded {len(users)} existing users")
+        if len(str(password).encode()) > MAX_PASSWORD_BYTES:
+            logger.warning("Signup validation failed: password too long")
+            return {'error': f'Password must be at most {MAX_PASSWORD_BYTES} bytes'}, 400
 
         # Check if username already exists
-        if any(u.get('username') == username for u in users):
+        if get_user_by_username(username) is not None:
             logger.warning(f"Signup failed: Username {username} already exists")
             return {'error': 'Username already exists'}, 400
 
@@ -81,34 +80,22 @@ class Signup(Resource):
         new_user = {
             'id': str(uuid.uuid4()),
             'username': username,
-            'password': password,
+            'password': hash_password(password),
             'email': email,
             'firstName': firstName,
             'lastName': lastName
         }
         logger.debug(f"Created new user with ID: {new_user['id']}")
-        
-        users.append(new_user)
 
-        try:
-            # Save updated users list
-            logger.debug("Saving updated users list")
-            with open(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'users.txt'), 'w') as f:
-                json.dump(users, f, indent=4)
-            logger.debug("Users list saved successfully")
-        except Exception as e:
-            logger.error(f"Error saving user data: {str(e)}")
-            return {'error': 'Failed to save user data', 'message': str(e)}, 500
+        # Index the user in memory; users.txt is written in the background.
+        # add_user re-checks the username under lock to catch concurrent signups.
+        if not add_user(new_user):
+            logger.warning(f"Signup failed: Username {username} already exists")
+            return {'error': 'Username already exists'}, 400
 
         # Generate JWT token
         logger.debug("Generating JWT token")
-        from flask import current_app
-        token = jwt.encode({
-            'sub': new_user['id'],
-            'username': new_user['username'],
-            'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=1),
-            'aud': 'authenticated'
-        }, current_app.config['SECRET_KEY'], algorithm='HS256')
+        token = encode_token(new_user)
         logger.debug(f"Token generated: {token[:10]}...")
 
         # Exclude password from response
@@ -134,7 +121,7 @@ class Login(Resource):
             int: HTTP 200 on success, 400 on validation error, 401 on invalid credentials.
         """
         logger.info("Login endpoint called")
-        data = request.get_json()
+        data = json_body()
         username = data.get('username')
         password = data.get('password')
         logger.info(f"Login attempt for username: {username}")
@@ -143,23 +130,15 @@ class Login(Resource):
             logger.warning("Login validation failed: missing username or password")
             return {'error': 'Username and password are required'}, 400
         
-        users = load_users()
-        logger.debug(f"Loaded {len(users)} users")
-        user = next((u for u in users if u.get('username') == username and u.get('password') == password), None)
+        user = get_user_by_username(username)
         
-        if not user:
+        if not user or not verify_password(user, password):
             logger.warning(f"Invalid credentials for username: {username}")
             return {'error': 'Invalid credentials'}, 401
         
         logger.debug(f"Valid credentials for user: {user.get('id')}")
         logger.debug("Generating JWT token")
-        from flask import current_app
-        token = jwt.encode({
-            'sub': user['id'],
-            'username': user['username'],
-            'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=1),
-            'aud': 'authenticated'
-        }, current_app.config['SECRET_KEY'], algorithm='HS256')
+        token = encode_token(user)
         logger.debug(f"Token generated: {token[:10]}...")
         
         user_data = {k: user[k] for k in user if k != 'password'}
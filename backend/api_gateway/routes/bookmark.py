@@ -6,15 +6,14 @@ This module contains the API routes for bookmark operations including adding, li
 """
 
 # Standard library imports
-from flask import jsonify, request, make_response
+from flask import jsonify, request, make_response, g
 from flask_restx import Resource, Namespace
-import jwt
 from functools import wraps
-from flask import current_app
 
 # Import microservices and utilities
 from backend.microservices.news_storage import add_bookmark, get_user_bookmarks, delete_bookmark
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import json_body
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -40,11 +39,7 @@ class Bookmark(Resource):
         """
         try:
             logger.info("Get bookmarks endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Getting bookmarks for user: {user_id}")
 
             bookmarks = get_user_bookmarks(user_id)
@@ -80,14 +75,10 @@ class Bookmark(Resource):
         """
         try:
             logger.info("Add bookmark endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Adding bookmark for user: {user_id}")
 
-            data = request.get_json()
+            data = json_body()
             news_id = data.get('news_id')
             logger.debug(f"News article ID: {news_id}")
 
@@ -132,11 +123,7 @@ class BookmarkDelete(Resource):
         """
         try:
             logger.info(f"Delete bookmark endpoint called for bookmark: {bookmark_id}")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Deleting bookmark {bookmark_id} for user {user_id}")
 
             result = delete_bookmark(user_id, bookmark_id)
@@ -7,15 +7,20 @@ This module contains the API routes for news operations including fetching and p
 
 # Standard library imports
 from flask import jsonify, request, make_response
-from flask_restx import Resource, Namespace
-import jwt
+from flask_restx import Resource, Namespace, fields
+from werkzeug.exceptions import BadRequest
 import traceback
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 # Import microservices and utilities
 from backend.microservices.news_fetcher import fetch_news
-from backend.microservices.news_storage import store_article_in_supabase, log_user_search
+from backend.microservices.news_storage import store_articles_in_supabase, log_user_searches
 from backend.microservices.summarization_service import process_articles
+from backend.api_gateway.utils.auth import bearer_token, decode_token
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import json_body
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -23,6 +28,21 @@ logger = setup_logger(__name__)
 # Create news namespace
 news_ns = Namespace('api/news', description='News operations')
 
+# Define API models for request/response documentation
+fetch_batch_model = news_ns.model('FetchBatch', {
+    'keywords': fields.List(fields.String, required=True, description='Search keywords (at most 20)')
+})
+
+# Maximum number of keywords accepted by /fetch_batch in one request
+MAX_BATCH_KEYWORDS = 20
+
+# Pool for running a batch's News API fetches in parallel
+_fetch_pool = ThreadPoolExecutor(max_workers=8)
+
+# Pool for writing search history after the response has been built;
+# log_user_searches logs its own failures
+_log_pool = ThreadPoolExecutor(max_workers=4)
+
 @news_ns.route('/fetch')
 class NewsFetch(Resource):
     @news_ns.param('keyword', 'Search keyword for news')
@@ -33,15 +53,19 @@ class NewsFetch(Resource):
         
         This endpoint fetches news articles matching the provided keyword,
         stores them in Supabase, and logs the search history if a user ID is provided.
+        The search history is written in the background and does not delay the response.
         
         Args:
             keyword (str): The search term for fetching news articles.
             user_id (str, optional): User ID for logging search history.
             session_id (str): Session ID for tracking the request.
             
+        Successful responses carry a weak ETag derived from the article IDs and
+        may be cached for 60 seconds.
+        
         Returns:
             dict: Contains the stored article IDs and success status.
-            int: HTTP 200 on success, 500 on error.
+            int: HTTP 200 on success, 304 if the If-None-Match ETag still matches, 500 on error.
         """
         try:
             keyword = request.args.get('keyword', '')
@@ -53,28 +77,119 @@ class NewsFetch(Resource):
             articles = fetch_news(keyword)  # This returns a list of articles.
             logger.info(f"Found {len(articles) if articles else 0} articles for keyword: '{keyword}'")
 
-            stored_article_ids = []
+            # Store all articles in one request; search history is written in the background
+            stored_article_ids = store_articles_in_supabase(articles)
+            logger.debug(f"Stored {len(stored_article_ids)} articles")
 
-            for article in articles:
-                logger.debug(f"Storing article: {article.get('title', 'No title')}")
-                article_id = store_article_in_supabase(article)
-                stored_article_ids.append(article_id)
-                logger.debug(f"Stored article with ID: {article_id}")
+            if user_id:
+                logger.debug(f"Queueing search log for user {user_id}, {len(stored_article_ids)} articles")
+                _log_pool.submit(log_user_searches, user_id, stored_article_ids, session_id)
 
-                if user_id:
-                    logger.debug(f"Logging search for user {user_id}, article {article_id}")
-                    log_user_search(user_id, article_id, session_id)
+            # Weak ETag over the result set so clients can revalidate with If-None-Match
+            etag = hashlib.md5(",".join(map(str, sorted(stored_article_ids))).encode()).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                logger.info("Article IDs unchanged, returning 304")
+                response = make_response('', 304)
+            else:
+                logger.info(f"Returning {len(stored_article_ids)} article IDs")
+                response = make_response(jsonify({
+                    'status': 'success',
+                    'data': stored_article_ids
+                }), 200)
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'public, max-age=60'
+            return response
+
+        except Exception as e:
+            # Capture the full stack trace
+            stack_trace = traceback.format_exc()
+            logger.error(f"Error fetching news: {str(e)}\nStack trace: {stack_trace}")
+            return make_response(jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 500)
+
+@news_ns.route('/fetch_batch')
+class NewsFetchBatch(Resource):
+    @news_ns.expect(fetch_batch_model)
+    @news_ns.param('user_id', 'User ID for logging search history')
+    @news_ns.param('session_id', 'Session ID for tracking requests')
+    def post(self):
+        """Fetch and store news articles for several keywords in one request.
+        
+        Batched variant of /fetch. The News API is queried for all keywords in
+        parallel and every resulting article is stored with a single Supabase call.
+        
+        Expected JSON payload:
+        {
+            'keywords': list of str (required, at most 20)
+        }
+        
+        Returns:
+            dict: Maps each keyword to its stored article IDs, plus success status.
+            int: HTTP 200 on success, 400 on validation error, 500 on error.
+        """
+        try:
+            data = json_body()
+        except BadRequest as e:
+            logger.warning(f"Fetch batch validation failed: {e.description}")
+            return make_response(jsonify({
+                'status': 'error',
+                'message': e.description
+            }), 400)
+        if not isinstance(data, dict):
+            logger.warning("Fetch batch validation failed: body is not a JSON object")
+            return make_response(jsonify({
+                'status': 'error',
+                'message': 'Request body must be a JSON object'
+            }), 400)
+
+        try:
+            user_id = request.args.get('user_id')  # optional
+            session_id = request.args.get('session_id')
+            keywords = data.get('keywords')
+            logger.info(f"News fetch batch endpoint called with keywords: {keywords}, user_id: {user_id}, session_id: {session_id}")
+
+            if not isinstance(keywords, list) or not keywords or not all(isinstance(k, str) for k in keywords):
+                logger.warning("Fetch batch validation failed: keywords must be a non-empty list of strings")
+                return make_response(jsonify({
+                    'status': 'error',
+                    'message': 'keywords must be a non-empty list of strings'
+                }), 400)
+            if len(keywords) > MAX_BATCH_KEYWORDS:
+                logger.warning(f"Fetch batch validation failed: {len(keywords)} keywords")
+                return make_response(jsonify({
+                    'status': 'error',
+                    'message': f'At most {MAX_BATCH_KEYWORDS} keywords are allowed per request'
+                }), 400)
+
+            keywords = list(dict.fromkeys(keywords))
+            results = [articles or [] for articles in _fetch_pool.map(fetch_news, keywords)]
+            logger.info(f"Found {sum(len(articles) for articles in results)} articles for {len(keywords)} keywords")
+
+            stored_article_ids = store_articles_in_supabase(list(chain.from_iterable(results)))
+
+            # Split the flat ID list back into one slice per keyword
+            data = {}
+            offset = 0
+            for keyword, articles in zip(keywords, results):
+                data[keyword] = stored_article_ids[offset:offset + len(articles)]
+                offset += len(articles)
+
+            if user_id:
+                unique_ids = list(dict.fromkeys(stored_article_ids))
+                logger.debug(f"Queueing search log for user {user_id}, {len(unique_ids)} articles")
+                _log_pool.submit(log_user_searches, user_id, unique_ids, session_id)
 
-            logger.info(f"Returning {len(stored_article_ids)} article IDs")
             return make_response(jsonify({
                 'status': 'success',
-                'data': stored_article_ids
+                'data': data
             }), 200)
 
         except Exception as e:
             # Capture the full stack trace
             stack_trace = traceback.format_exc()
-            logger.error(f"Error fetching news: {str(e)}\nStack trace: {stack_trace}")
+            logger.error(f"Error fetching news batch: {str(e)}\nStack trace: {stack_trace}")
             return make_response(jsonify({
                 'status': 'error',
                 'message': str(e)
@@ -98,13 +213,10 @@ class NewsProcess(Resource):
             
             # Try to get user_id from JWT token if it exists
             user_id = None
-            auth_header = request.headers.get('Authorization')
-            if auth_header:
+            token = bearer_token()
+            if token:
                 try:
-                    token = auth_header.split()[1]  # Extract token from 'Bearer <token>'
-                    # Note: The secret key should be imported from the main app
-                    from flask import current_app
-                    payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
+                    payload = decode_token(token)
                     user_id = payload.get('sub')
                     logger.debug(f"Extracted user_id from token: {user_id}")
                 except Exception as e:
@@ -113,7 +225,7 @@ class NewsProcess(Resource):
             logger.info(f"News process endpoint called with session_id: {session_id}, user_id: {user_id}")
             
             # Get article_ids from request body
-            request_data = request.get_json()
+            request_data = json_body()
             article_ids = request_data.get('article_ids', [])
             
             logger.debug(f"Article IDs from request: {article_ids}")
@@ -7,15 +7,16 @@ creating, retrieving, updating, and deleting tracked stories.
 """
 
 # Standard library imports
-from flask import jsonify, request, make_response
+from flask import jsonify, request, make_response, g
 from flask_restx import Resource, Namespace
-import jwt
 from datetime import datetime
 import os
+import threading
+from cachetools import TTLCache
 
 # Import microservices and utilities
 from backend.microservices.news_fetcher import fetch_news
-from backend.microservices.news_storage import store_article_in_supabase
+from backend.microservices.news_storage import store_articles_in_supabase
 from backend.microservices.story_tracking_service import (
     get_tracked_stories, 
     create_tracked_story, 
@@ -24,6 +25,7 @@ from backend.microservices.story_tracking_service import (
     toggle_polling
 )
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import json_body
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -31,6 +33,39 @@ logger = setup_logger(__name__)
 # Create story tracking namespace
 story_tracking_ns = Namespace('api/story_tracking', description='Story tracking operations')
 
+# Short-lived cache of story details for dashboards that poll a story. The
+# write endpoints below invalidate the affected entry, but only in this
+# process: other gunicorn workers and replicas (and the polling worker, which
+# adds articles directly) are not notified, so details may be up to 10 seconds
+# stale after a write handled elsewhere. Users' story lists are not cached, so
+# a story created or deleted on any worker shows up in the list at once.
+_story_details_cache = TTLCache(maxsize=2000, ttl=10)
+_story_cache_lock = threading.Lock()
+
+# Bumped on every invalidation. A fill that started before an invalidation
+# may hold pre-write data, so it is not stored.
+_story_cache_generation = 0
+
+def _cached_story_details(story_id):
+    """Return get_story_details(story_id), served from cache when fresh."""
+    with _story_cache_lock:
+        story = _story_details_cache.get(story_id)
+        generation = _story_cache_generation
+    if story is None:
+        story = get_story_details(story_id)
+        if story:
+            with _story_cache_lock:
+                if generation == _story_cache_generation:
+                    _story_details_cache[story_id] = story
+    return story
+
+def _invalidate_story_cache(story_id):
+    """Drop the cached details of a story touched by a write."""
+    global _story_cache_generation
+    with _story_cache_lock:
+        _story_cache_generation += 1
+        _story_details_cache.pop(story_id, None)
+
 # Import token_required decorator from utils
 from backend.api_gateway.utils.auth import token_required
 
@@ -65,17 +100,21 @@ class StoryTracking(Resource):
             logger.info(f"Found {len(articles) if articles else 0} articles for keyword: '{keyword}'")
             
             
+            # Store all articles in one batch, keeping IDs in article order
+            article_ids = store_articles_in_supabase(articles)
+            logger.debug(f"Stored {len(article_ids)} articles")
+
+            # Fallback publish time, computed once for the whole batch
+            now_iso = datetime.now().isoformat()
             processed_articles = []
-            for article in articles:
-                logger.debug(f"Processing article: {article.get('title', 'No title')}")
-                article_id = store_article_in_supabase(article)
-                logger.debug(f"Stored article with ID: {article_id}")
+            for article, article_id in zip(articles, article_ids):
+                source = article.get('source')
                 processed_articles.append({
                     'id': article_id,
                     'title': article.get('title'),
                     'url': article.get('url'),
-                    'source': article.get('source', {}).get('name') if isinstance(article.get('source'), dict) else article.get('source'),
-                    'publishedAt': article.get('publishedAt', datetime.now().isoformat())
+                    'source': source.get('name') if isinstance(source, dict) else source,
+                    'publishedAt': article.get('publishedAt', now_iso)
                 })
 
             logger.info(f"Returning {len(processed_articles)} processed articles")
@@ -110,16 +149,10 @@ class StoryTracking(Resource):
         """
         try:
             logger.debug("Story tracking post endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            # Import app from main module to access config
-            from flask import current_app
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Creating tracked story for user: {user_id}")
             
-            data = request.get_json()
+            data = json_body()
             keyword = data.get('keyword')
             source_article_id = data.get('sourceArticleId')
             logger.debug(f"Story details - Keyword: '{keyword}', Source article: {source_article_id}")
@@ -136,7 +169,7 @@ class StoryTracking(Resource):
             logger.info(f"Tracked story created with ID: {tracked_story['id'] if tracked_story else 'unknown'}")
             
             logger.debug(f"Getting full story details for story: {tracked_story['id']}")
-            story_with_articles = get_story_details(tracked_story['id'])
+            story_with_articles = _cached_story_details(tracked_story['id'])
             logger.info(f"Found {len(story_with_articles.get('articles', [])) if story_with_articles else 0} related articles")
             
             return make_response(jsonify({
@@ -151,25 +184,6 @@ class StoryTracking(Resource):
                 'message': str(e)
             }), 500)
 
-@story_tracking_ns.route('', methods=['OPTIONS'])
-class StoryTrackingOptions(Resource):
-    def options(self):
-        """Handle OPTIONS requests for the story tracking endpoint.
-
-        This function sets the necessary CORS headers for preflight requests
-        to the story tracking endpoint.
-
-        Returns:
-            Response: A Flask response object with appropriate CORS headers.
-        """
-        print("[DEBUG] [api_gateway] [story_tracking_options] Called")
-        response = make_response()
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type,Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "GET,POST,PUT,DELETE,OPTIONS")
-        print("[DEBUG] [api_gateway] [story_tracking_options] Responding with CORS headers")
-        return response
-
 @story_tracking_ns.route('/start')
 class StartStoryTracking(Resource):
     @token_required
@@ -187,16 +201,10 @@ class StartStoryTracking(Resource):
         """
         try:
             logger.debug("Start story tracking endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            # Import app from main module to access config
-            from flask import current_app
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Starting polling for user: {user_id}")
             
-            data = request.get_json()
+            data = json_body()
             story_id = data.get('story_id')
             logger.debug(f"Story ID: {story_id}")
             
@@ -209,6 +217,7 @@ class StartStoryTracking(Resource):
             
             logger.debug(f"Calling toggle_polling with user_id: {user_id}, story_id: {story_id}, enable=True")
             updated_story = toggle_polling(user_id, story_id, enable=True)
+            _invalidate_story_cache(story_id)
             
             if not updated_story:
                 logger.warning(f"No story found with ID {story_id} for user {user_id}")
@@ -248,16 +257,10 @@ class StopStoryTracking(Resource):
         """
         try:
             logger.debug("Stop story tracking endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            # Import app from main module to access config
-            from flask import current_app
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Stopping polling for user: {user_id}")
             
-            data = request.get_json()
+            data = json_body()
             story_id = data.get('story_id')
             logger.debug(f"Story ID: {story_id}")
             
@@ -270,6 +273,7 @@ class StopStoryTracking(Resource):
             
             logger.debug(f"Calling toggle_polling with user_id: {user_id}, story_id: {story_id}, enable=False")
             updated_story = toggle_polling(user_id, story_id, enable=False)
+            _invalidate_story_cache(story_id)
             
             if not updated_story:
                 logger.warning(f"No story found with ID {story_id} for user {user_id}")
@@ -307,13 +311,7 @@ class UserStoryTracking(Resource):
         """
         try:
             logger.debug("User story tracking endpoint called")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            # Import app from main module to access config
-            from flask import current_app
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Getting tracked stories for user: {user_id}")
             
             logger.debug(f"Calling get_tracked_stories")
@@ -351,7 +349,7 @@ class StoryTrackingDetail(Resource):
         try:
             logger.debug(f"Story tracking detail endpoint called for story: {story_id}")
             logger.debug(f"Calling get_story_details for story: {story_id}")
-            story = get_story_details(story_id)
+            story = _cached_story_details(story_id)
             
             if not story:
                 logger.warning(f"No story found with ID: {story_id}")
@@ -390,17 +388,12 @@ class StoryTrackingDetail(Resource):
         """
         try:
             logger.debug(f"Delete story tracking endpoint called for story: {story_id}")
-            auth_header = request.headers.get('Authorization')
-            token = auth_header.split()[1]
-            logger.debug(f"Decoding token: {token[:10]}...")
-            # Import app from main module to access config
-            from flask import current_app
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            user_id = payload.get('sub')
+            user_id = g.user_id
             logger.info(f"Deleting tracked story {story_id} for user {user_id}")
             
             logger.debug(f"Calling delete_tracked_story")
             success = delete_tracked_story(user_id, story_id)
+            _invalidate_story_cache(story_id)
             logger.debug(f"Delete result: {success}")
             
             if not success:
@@ -6,12 +6,12 @@ This module contains the API routes for text summarization operations.
 """
 
 # Standard library imports
-from flask import request
 from flask_restx import Resource, Namespace, fields
 
 # Import microservices and utilities
 from backend.microservices.summarization_service import run_summarization
 from backend.core.utils import setup_logger
+from backend.api_gateway.utils.serialization import json_body
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -38,9 +38,8 @@ class Summarize(Resource):
             int: HTTP 200 status code on success.
         """
         logger.info("Summarize endpoint called")
-        data = request.get_json()
+        data = json_body()
         article_text = data.get('article_text', '')
-        logger.debug(f"Summarizing text of length: {len(article_text)}")
         summary = run_summarization(article_text)
-        logger.debug(f"Summarization complete, summary length: {len(summary)}")
+        logger.debug("Summarization complete, summary length: %d", len(summary))
         return {"summary": summary}, 200
\ No newline at end of file
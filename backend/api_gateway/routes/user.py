@@ -6,14 +6,12 @@ This module contains the API routes for user operations including profile manage
 """
 
 # Standard library imports
-from flask import jsonify, request, make_response
+from flask import jsonify, request, make_response, g
 from flask_restx import Resource, Namespace, fields
-import jwt
 
 # Import microservices and utilities
-from backend.microservices.auth_service import load_users
+from backend.microservices.auth_service import get_user_by_id
 from functools import wraps
-from flask import current_app
 from backend.core.utils import setup_logger
 
 # Initialize logger
@@ -32,13 +30,16 @@ user_profile_model = user_ns.model('UserProfile', {
     'avatarUrl': fields.String(description='URL to user avatar')
 })
 
+# Fields returned by the profile endpoint, matching user_profile_model
+_PROFILE_FIELDS = ('id', 'username', 'email', 'firstName', 'lastName', 'avatarUrl')
+
 # Import token_required decorator from utils
 from backend.api_gateway.utils.auth import token_required
 
 @user_ns.route('/profile')
 class UserProfile(Resource):
     @token_required
-    @user_ns.marshal_with(user_profile_model)
+    @user_ns.response(200, 'Success', user_profile_model)
     def get(self):
         """Retrieve authenticated user's profile information.
         
@@ -50,17 +51,13 @@ class UserProfile(Resource):
             int: HTTP 200 on success, 404 if user not found.
         """
         logger.info("User profile endpoint called")
-        auth_header = request.headers.get('Authorization')
-        token = auth_header.split()[1]
-        logger.debug(f"Decoding token: {token[:10]}...")
-        payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-        logger.debug(f"Looking up user with ID: {payload.get('sub')}")
+        user_id = g.user_id
+        logger.debug(f"Looking up user with ID: {user_id}")
         
-        users = load_users()
-        user = next((u for u in users if u.get('id') == payload.get('sub')), None)
+        user = get_user_by_id(user_id)
         if not user:
-            logger.warning(f"User not found with ID: {payload.get('sub')}")
+            logger.warning(f"User not found with ID: {user_id}")
             return {'error': 'User not found'}, 404
             
         logger.debug(f"Found user: {user.get('username')}")
-        return {k: user[k] for k in user if k != 'password'}, 200
\ No newline at end of file
+        return {k: user[k] for k in _PROFILE_FIELDS if k in user}, 200
\ No newline at end of file
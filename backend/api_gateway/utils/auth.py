@@ -3,16 +3,149 @@
 Authentication Utilities
 
 This module provides authentication utilities for the News Aggregator API Gateway,
-including the token_required decorator for protecting routes that require authentication.
+including the token_required decorator for protecting routes that require authentication
+and helpers for issuing and decoding JWTs.
 """
 
 # Standard library imports
-from flask import request
+from flask import request, g
 from functools import wraps
+import datetime
+import hashlib
+import threading
+import time
 import jwt
+import orjson
+from cachetools import TTLCache
 
-# Import Flask app for accessing config
-from flask import current_app
+from backend.core.config import Config
+from backend.core.utils import setup_logger
+
+# Initialize logger
+logger = setup_logger(__name__)
+
+# Signing key, algorithm list and PyJWT/PyJWS instances are built once at
+# import rather than on every encode/decode. Decoding goes through PyJWS,
+# which only verifies the signature; the claims are checked in _verify_claims.
+_JWT_SECRET = Config.JWT_SECRET_KEY.encode()
+_JWT_ALGS = ['HS256']
+_JWT = jwt.PyJWT()
+_JWS = jwt.PyJWS(algorithms=_JWT_ALGS)
+
+# Decoded JWT payloads keyed by SHA-256 of the raw token, so repeat requests
+# with the same bearer token skip HMAC verification. Entries are also dropped
+# once the token expires, so the TTL only bounds how long idle tokens linger.
+_jwt_cache = TTLCache(maxsize=10000, ttl=300)
+_jwt_cache_lock = threading.Lock()
+
+def bearer_token():
+    """Extract the token from a 'Bearer <token>' Authorization header.
+
+    Returns:
+        str: The token, or an empty string if the header is missing or malformed.
+    """
+    header = request.headers.get('Authorization', '')
+    if header.startswith('Bearer '):
+        return header[7:]
+    return header.partition(' ')[2]
+
+def _verify_claims(payload, audience):
+    """Check the registered claims of a signature-verified payload.
+
+    Mirrors jwt.decode in PyJWT 2.8 with default options and no leeway:
+    'iat', 'nbf' and 'exp' are checked when present, in that order, and
+    'aud' is required and must contain the expected audience.
+
+    Raises:
+        jwt.InvalidTokenError: If a claim is missing, malformed or fails validation.
+    """
+    now = time.time()
+
+    if 'iat' in payload:
+        try:
+            iat = int(payload['iat'])
+        except ValueError:
+            raise jwt.InvalidIssuedAtError('Issued At claim (iat) must be an integer.')
+        if iat > now:
+            raise jwt.ImmatureSignatureError('The token is not yet valid (iat)')
+
+    if 'nbf' in payload:
+        try:
+            nbf = int(payload['nbf'])
+        except ValueError:
+            raise jwt.DecodeError('Not Before claim (nbf) must be an integer.')
+        if nbf > now:
+            raise jwt.ImmatureSignatureError('The token is not yet valid (nbf)')
+
+    if 'exp' in payload:
+        try:
+            exp = int(payload['exp'])
+        except ValueError:
+            raise jwt.DecodeError('Expiration Time claim (exp) must be an integer.')
+        if exp <= now:
+            raise jwt.ExpiredSignatureError('Signature has expired')
+
+    if 'aud' not in payload:
+        raise jwt.MissingRequiredClaimError('aud')
+    aud = payload['aud']
+    if isinstance(aud, str):
+        aud = [aud]
+    if not isinstance(aud, list) or any(not isinstance(c, str) for c in aud):
+        raise jwt.InvalidAudienceError('Invalid claim format in token')
+    if audience not in aud:
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+def decode_token(token, audience='authenticated'):
+    """Decode and validate a JWT, reusing recently verified payloads.
+
+    Cached payloads are dropped as soon as the token's own 'exp' claim has
+    passed, so a cache hit never outlives the token itself.
+
+    Args:
+        token (str): The raw JWT taken from the Authorization header.
+        audience (str, optional): Expected 'aud' claim. Defaults to 'authenticated'.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or expired.
+    """
+    key = (hashlib.sha256(token.encode()).digest(), audience)
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+        if payload is not None and 'exp' in payload and int(payload['exp']) <= time.time():
+            del _jwt_cache[key]
+            payload = None
+    if payload is not None:
+        return payload
+
+    try:
+        payload = orjson.loads(_JWS.decode(token, _JWT_SECRET, algorithms=_JWT_ALGS))
+    except orjson.JSONDecodeError as e:
+        raise jwt.DecodeError(f"Invalid payload string: {e}")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    _verify_claims(payload, audience)
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
+
+def encode_token(user):
+    """Issue a one-hour JWT for the given user.
+
+    Args:
+        user (dict): The user record. Must contain 'id' and 'username'.
+
+    Returns:
+        str: The signed token.
+    """
+    return _JWT.encode({
+        'sub': user['id'],
+        'username': user['username'],
+        'exp': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1),
+        'aud': 'authenticated'
+    }, _JWT_SECRET, algorithm=_JWT_ALGS[0])
 
 def token_required(f):
     """Decorator to protect routes that require authentication.
@@ -31,19 +164,17 @@ def token_required(f):
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        print("[DEBUG] [api_gateway] [token_required] Checking token in request")
-        auth_header = request.headers.get('Authorization')
-        if not auth_header:
-            print("[DEBUG] [api_gateway] [token_required] Authorization header missing")
+        if not request.headers.get('Authorization'):
+            logger.debug("Authorization header missing")
             return {'error': 'Authorization header missing'}, 401
         try:
-            token = auth_header.split()[1]  # Extract token from 'Bearer <token>'
-            print(f"[DEBUG] [api_gateway] [token_required] Decoding token: {token[:10]}...")
-            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'], audience='authenticated')
-            print(f"[DEBUG] [api_gateway] [token_required] Token decoded successfully, user: {payload.get('sub', 'unknown')}")
+            token = bearer_token()
+            payload = decode_token(token)
+            g.jwt_payload = payload
+            g.user_id = payload.get('sub')
 
             return f(*args, **kwargs)
         except Exception as e:
-            print(f"[DEBUG] [api_gateway] [token_required] Token validation error: {str(e)}")
+            logger.debug("Token validation error: %s", e)
             return {'error': 'Invalid token', 'message': str(e)}, 401
     return decorated
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Serialization Utilities
+
+This module provides JSON serialization helpers for the News Aggregator API Gateway,
+backed by orjson, which is considerably faster than the standard library json module
+for the article lists returned by the news, bookmark and story tracking endpoints.
+"""
+
+# Standard library imports
+from flask import request, make_response
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import BadRequest
+import orjson
+
+# Options applied to every response body
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson.
+
+    Used for jsonify() and any other call that goes through app.json.
+    Types orjson does not handle natively fall back to their string form.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """Flask-RestX representation that serializes resource results with orjson.
+
+    Flask-RestX does not go through app.json for the (data, status) tuples
+    returned by resources, so this is registered on the Api to cover them.
+
+    Args:
+        data: The object returned by the resource.
+        code (int): The HTTP status code.
+        headers (dict, optional): Extra response headers.
+
+    Returns:
+        Response: The JSON response.
+    """
+    response = make_response(orjson.dumps(data, default=str, option=_ORJSON_OPTIONS), code)
+    response.headers['Content-Type'] = 'application/json'
+    response.headers.extend(headers or {})
+    return response
+
+def json_body():
+    """Parse the current request body as JSON with orjson.
+
+    Reads the raw body once without caching it on the request and skips
+    Flask's content-type checks, so large payloads such as article text are
+    not buffered twice.
+
+    Returns:
+        dict: The decoded body, or an empty dict if the body is empty.
+
+    Raises:
+        BadRequest: If the body is not valid JSON.
+    """
+    data = request.get_data(cache=False)
+    if not data:
+        return {}
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError as e:
+        raise BadRequest(f"Failed to decode JSON object: {e}")
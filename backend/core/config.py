@@ -25,6 +25,11 @@ class Config:
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     
+    # News API cache: seconds to reuse results for a repeated keyword
+    NEWS_CACHE_TTL = int(os.getenv('NEWS_CACHE_TTL', 120))
+
+    # JWT secret key for token signing
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your-secret-key')
 
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
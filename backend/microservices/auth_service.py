@@ -25,7 +25,21 @@ import json
 import datetime
 import jwt
 import os
+import hmac
+import threading
+import fcntl
+import bcrypt
+import gevent
+import gevent.monkey
+import orjson
+from cachetools import LRUCache
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from backend.core.utils import setup_logger
+
+# Initialize logger
+logger = setup_logger(__name__)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # Change this in production
@@ -33,6 +47,9 @@ app.config['SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')  # Cha
 # Get the path to the users file
 USERS_FILE = Path(__file__).parent.parent / 'data' / 'users.txt'
 
+# Lock file serializing read-merge-write cycles on users.txt across worker processes
+USERS_LOCK_FILE = USERS_FILE.with_name(f"{USERS_FILE.name}.lock")
+
 # Ensure the data directory exists
 USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
@@ -50,6 +67,11 @@ if not USERS_FILE.exists():
             }
         ], f)
 
+def _read_users_file():
+    """Read and parse users.txt, raising on any error."""
+    with open(USERS_FILE, 'rb') as f:
+        return orjson.loads(f.read())
+
 def load_users():
     """Load user data from the users.txt file.
     
@@ -63,18 +85,284 @@ def load_users():
               {
                   'id': int,
                   'username': str,
-                  'password': str,
+                  'password': str (bcrypt hash; plaintext for legacy entries),
                   'email': str,
                   'firstName': str,
                   'lastName': str
               }
-    
-    Raises:
-        Exception: If there's an error reading or parsing the users file.
+              An empty list if the file cannot be read.
     """
     try:
-        with open(USERS_FILE, 'r') as f:
-            return json.load(f)
+        return _read_users_file()
     except Exception as e:
-        print(f"Error loading users: {e}")
+        logger.error("Error loading users: %s", e)
         return []
+
+def _run_blocking(func, *args):
+    """Run a blocking call without stalling the other requests in this worker.
+
+    Under gunicorn's gevent workers every request in a process shares one OS
+    thread, and monkey-patched ThreadPoolExecutor threads are greenlets too, so
+    a blocking call made inline (a ~250ms bcrypt hash, or waiting on another
+    worker's file lock) freezes them all. gevent's hub threadpool uses real OS
+    threads, and both bcrypt and flock release the GIL while they wait. Without
+    monkey-patching (e.g. the Flask development server) the call runs inline.
+    """
+    if gevent.monkey.is_module_patched('threading'):
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+@contextmanager
+def _users_file_lock():
+    """Hold an exclusive lock on users.txt shared by all worker processes."""
+    with open(USERS_LOCK_FILE, 'a') as f:
+        _run_blocking(fcntl.flock, f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+# Process-wide user indexes, loaded at import and refreshed from users.txt
+_users_lock = threading.RLock()
+_users = []
+_users_by_name = {}
+_users_by_id = {}
+
+# IDs of users created or changed in this process that users.txt does not
+# have yet. These win over the file when merging; everything else is taken
+# from the file, so changes made by other workers are picked up.
+_users_pending = set()
+
+# (inode, mtime) of the users.txt last merged. users.txt is always replaced
+# with os.replace, so every write gives it a new inode; lookups only re-read
+# the file when this changes.
+_users_file_version = None
+
+# Single worker so writes to users.txt are applied in submission order
+_users_writer = ThreadPoolExecutor(max_workers=1)
+
+def _merge_users(file_users):
+    """Rebuild the in-memory indexes from users.txt plus this process's pending changes.
+
+    Must be called with _users_lock held.
+    """
+    merged = {u.get('id'): u for u in file_users}
+    for user_id in _users_pending:
+        merged[user_id] = _users_by_id[user_id]
+    _users[:] = merged.values()
+    _users_by_name.clear()
+    _users_by_name.update((u.get('username'), u) for u in _users)
+    _users_by_id.clear()
+    _users_by_id.update(merged)
+
+def _users_file_stat():
+    st = os.stat(USERS_FILE)
+    return (st.st_ino, st.st_mtime_ns)
+
+def _refresh_users():
+    """Pick up users added or changed in users.txt by other worker processes.
+
+    Gunicorn runs several workers, each with its own in-memory index. The
+    file is only re-read when its inode or mtime has changed since the last
+    merge. It is always replaced atomically, so it can be read without the
+    lock. If it cannot be read, the current indexes are kept.
+    """
+    global _users_file_version
+    try:
+        version = _users_file_stat()
+        if version == _users_file_version:
+            return
+        file_users = _read_users_file()
+    except Exception as e:
+        logger.error("Error loading users: %s", e)
+        return
+    with _users_lock:
+        _merge_users(file_users)
+        # Stat taken before the read, so a write in between is re-read next time
+        _users_file_version = version
+
+def _persist_users():
+    """Write this process's pending user changes to users.txt.
+
+    The file is always re-read, merged and replaced while holding the
+    inter-process lock, so concurrent writes from other workers are never lost.
+    """
+    global _users_file_version
+    with _users_file_lock():
+        try:
+            file_users = _read_users_file()
+        except Exception as e:
+            logger.error("Error loading users, postponing save: %s", e)
+            return
+        with _users_lock:
+            _merge_users(file_users)
+            users = list(_users)
+            written = set(_users_pending)
+        if save_users(users):
+            # No other worker can replace the file while the lock is held,
+            # so this stat is of the file just written
+            try:
+                version = _users_file_stat()
+            except OSError:
+                version = None
+            with _users_lock:
+                _users_pending.difference_update(written)
+                _users_file_version = version
+
+_refresh_users()
+
+# Results of recent bcrypt checks keyed by (stored hash, HMAC of the
+# candidate password), so repeat logins skip the ~100ms hash computation
+# without keeping plaintext passwords around
+_verify_cache = LRUCache(maxsize=2048)
+_verify_cache_lock = threading.Lock()
+
+def get_user_by_username(username):
+    """Look up a user by username in the in-memory index.
+
+    Args:
+        username (str): The username to look up.
+
+    Returns:
+        dict or None: The user record, or None if no such user exists.
+    """
+    user = _users_by_name.get(username)
+    if user is None:
+        _refresh_users()
+        user = _users_by_name.get(username)
+    return user
+
+def get_user_by_id(user_id):
+    """Look up a user by ID in the in-memory index.
+
+    Args:
+        user_id (str): The user ID (the 'sub' claim of the JWT).
+
+    Returns:
+        dict or None: The user record, or None if no such user exists.
+    """
+    user = _users_by_id.get(user_id)
+    if user is None:
+        _refresh_users()
+        user = _users_by_id.get(user_id)
+    return user
+
+def save_users(users):
+    """Write the given user list to the users.txt file.
+
+    The list is written to a per-process temporary file that then replaces
+    users.txt in one step, so readers never see a partially written file.
+
+    Args:
+        users (list): The full list of user dictionaries to persist.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    tmp_file = USERS_FILE.with_name(f"{USERS_FILE.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(users))
+        os.replace(tmp_file, USERS_FILE)
+        return True
+    except Exception as e:
+        logger.error("Error saving users: %s", e)
+        return False
+
+# bcrypt only uses the first 72 bytes of a password; bcrypt 5 raises for
+# anything longer, so longer passwords are rejected at signup
+MAX_PASSWORD_BYTES = 72
+
+def hash_password(password):
+    """Hash a plaintext password with bcrypt.
+
+    Args:
+        password (str): The plaintext password, at most MAX_PASSWORD_BYTES long.
+
+    Returns:
+        str: The bcrypt hash, including its salt.
+
+    Raises:
+        ValueError: If the password is longer than MAX_PASSWORD_BYTES.
+    """
+    password = str(password).encode()
+    if len(password) > MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password longer than {MAX_PASSWORD_BYTES} bytes")
+    return _run_blocking(bcrypt.hashpw, password, bcrypt.gensalt(rounds=12)).decode()
+
+def _is_bcrypt_hash(value):
+    return isinstance(value, str) and value.startswith(('$2a$', '$2b$', '$2y$'))
+
+def verify_password(user, password):
+    """Check a candidate password against a user's stored password.
+
+    Users created before passwords were hashed still have plaintext entries
+    in users.txt. Those are compared in constant time and, on a match,
+    replaced with a bcrypt hash (unless the password is too long for bcrypt).
+    Stored values that are not strings never match.
+
+    Args:
+        user (dict): The user record holding the stored password.
+        password (str): The candidate password.
+
+    Returns:
+        bool: True if the password matches.
+    """
+    stored = user.get('password', '')
+    if not isinstance(stored, str):
+        return False
+    password = str(password).encode()
+
+    if not _is_bcrypt_hash(stored):
+        if not hmac.compare_digest(stored.encode(), password):
+            return False
+        if len(password) > MAX_PASSWORD_BYTES:
+            logger.warning("Password of user %s is too long to hash, keeping legacy entry", user.get('id'))
+            return True
+        # Hash before taking the lock so signups and refreshes are not held up
+        hashed = hash_password(password.decode())
+        with _users_lock:
+            user['password'] = hashed
+            _users_by_id.get(user.get('id'), user)['password'] = hashed
+            _users_pending.add(user.get('id'))
+        _users_writer.submit(_persist_users)
+        return True
+
+    # Hashes are only ever made from passwords within the bcrypt limit
+    if len(password) > MAX_PASSWORD_BYTES:
+        return False
+
+    # Keyed on an HMAC with the stored hash as key, so the cache holds no
+    # unsalted digests of candidate passwords
+    key = (stored, hmac.new(stored.encode(), password, 'sha256').digest())
+    with _verify_cache_lock:
+        result = _verify_cache.get(key)
+    if result is None:
+        result = _run_blocking(bcrypt.checkpw, password, stored.encode())
+        with _verify_cache_lock:
+            _verify_cache[key] = result
+    return result
+
+def add_user(user):
+    """Register a new user in memory and queue it for persistence.
+
+    The indexes are updated immediately so the user can log in straight away,
+    while the write to users.txt happens on a background thread.
+
+    Args:
+        user (dict): The new user record. Must contain 'id' and 'username'.
+
+    Returns:
+        bool: True if the user was added, False if the username is taken.
+    """
+    if get_user_by_username(user['username']) is not None:
+        return False
+    with _users_lock:
+        if user['username'] in _users_by_name:
+            return False
+        _users.append(user)
+        _users_by_name[user['username']] = user
+        _users_by_id[user['id']] = user
+        _users_pending.add(user['id'])
+    _users_writer.submit(_persist_users)
+    return True
@@ -14,14 +14,26 @@ Typical usage:
 
 Environment Variables Required:
     NEWS_API_KEY: API key for accessing the News API service
+
+Optional Environment Variables:
+    NEWS_CACHE_TTL: Seconds to cache results per keyword (default: 120)
 """
 
 import os
+import threading
+from concurrent.futures import Future
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import json
 from pathlib import Path
 from backend.core.config import Config
+from backend.core.utils import setup_logger
+
+# Initialize logger
+logger = setup_logger(__name__)
 
 # Load environment variables from .env file for configuration
 load_dotenv()
@@ -29,12 +41,35 @@ load_dotenv()
 # Initialize the News API key from environment variables
 NEWS_API_KEY = os.getenv('NEWS_API_KEY')
 
+# Persistent HTTP session so News API calls reuse pooled keep-alive
+# connections instead of opening a new TLS connection every time
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# (connect, read) timeouts in seconds, so a stalled upstream cannot hang a worker
+NEWS_API_TIMEOUT = (3.05, 10)
+
+# Recent News API results keyed by normalized keyword, so repeated searches
+# within NEWS_CACHE_TTL seconds do not spend another upstream request
+_news_cache = TTLCache(maxsize=1024, ttl=Config.NEWS_CACHE_TTL)
+_news_cache_lock = threading.Lock()
+
+# News API requests currently in flight, keyed like _news_cache. Concurrent
+# callers for the same keyword wait on the first caller's request.
+_inflight = {}
+
 def fetch_news(keyword='', session_id=None):
     """Fetch news articles from News API based on a keyword search.
 
     This function queries the News API to retrieve articles matching the provided
     keyword. It supports session-based tracking of requests and can handle empty
-    keyword searches.
+    keyword searches. Results are cached for NEWS_CACHE_TTL seconds per keyword, ignoring
+    case and surrounding whitespace, and concurrent calls for the same keyword
+    share a single upstream request.
 
     Args:
         keyword (str, optional): The search term to find relevant articles.
@@ -50,6 +85,44 @@ def fetch_news(keyword='', session_id=None):
         requests.exceptions.RequestException: If there's an error communicating
             with the News API.
     """
+    cache_key = (keyword or '').strip().lower()
+    with _news_cache_lock:
+        articles = _news_cache.get(cache_key)
+        future = None
+        is_leader = False
+        if articles is None:
+            future = _inflight.get(cache_key)
+            if future is None:
+                future = Future()
+                _inflight[cache_key] = future
+                is_leader = True
+    if articles is not None:
+        return list(articles)
+
+    if not is_leader:
+        articles = future.result()
+        return list(articles) if articles is not None else None
+
+    try:
+        articles = _request_news(keyword)
+        with _news_cache_lock:
+            if articles is not None:
+                _news_cache[cache_key] = articles
+            _inflight.pop(cache_key, None)
+        future.set_result(articles)
+    except BaseException as e:
+        with _news_cache_lock:
+            _inflight.pop(cache_key, None)
+        future.set_exception(e)
+        raise
+    return list(articles) if articles is not None else None
+
+def _request_news(keyword):
+    """Query the News API for a keyword, bypassing the cache.
+
+    Returns:
+        list: The articles from the response, one per URL, or None on error.
+    """
     # Configure the News API endpoint and request parameters
     url = "https://newsapi.org/v2/everything"
     params = {
@@ -60,22 +133,28 @@ def fetch_news(keyword='', session_id=None):
 
     try:
         # Make a GET request to the News API
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params, timeout=NEWS_API_TIMEOUT)
         response.raise_for_status()
 
         # Process the response data
         news_data = response.json()
         if news_data.get('status') == 'ok':
-            articles = news_data.get('articles', [])
+            # The News API can return the same URL more than once; keep the first
+            # copy and drop articles without a URL, which cannot be stored
+            seen = set()
+            articles = [
+                article for article in news_data.get('articles', [])
+                if article.get('url') and not (article['url'] in seen or seen.add(article['url']))
+            ]
             if not articles:
-                print("No articles found for the given keyword.")
+                logger.warning("No articles found for keyword: %s", keyword)
             
             return articles
         else:
-            print("Failed to fetch news:", news_data.get('message'))
+            logger.warning("Failed to fetch news: %s", news_data.get('message'))
 
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching news: {e}")
+        logger.warning("Error fetching news: %s", e)
 
 def write_to_file(articles, session_id=None):
     """Save fetched news articles to a JSON file.
@@ -107,9 +186,9 @@ def write_to_file(articles, session_id=None):
         # Save the articles as formatted JSON for better readability
         with open(file_path, 'w') as file:
             json.dump(articles, file, indent=4)
-        print(f"Articles successfully saved to {file_path}")
+        logger.info("Articles successfully saved to %s", file_path)
     except IOError as e:
-        print(f"Error writing to file: {e}")
+        logger.error("Error writing to file: %s", e)
 
 if __name__ == '__main__':
     fetch_news()
\ No newline at end of file
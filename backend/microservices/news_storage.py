@@ -12,20 +12,22 @@ The module uses the Supabase client to interact with the following tables:
 Other functionality has been moved to dedicated modules:
 - User search history: storage/search_logger.py
 - Bookmark management: storage/bookmark_service.py
+- Shared Supabase client: storage/supabase_client.py
 
 Environment Variables Required:
 - VITE_SUPABASE_URL: Supabase project URL
 - VITE_SUPABASE_ANON_KEY: Supabase anonymous key for client operations
 """
 
-import os
 import datetime
 import logging
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import threading
+from cachetools import LRUCache
+from supabase import Client
 
 # Import functions from storage modules
-from backend.microservices.storage.search_logger import log_user_search
+from backend.microservices.storage.supabase_client import get_client
+from backend.microservices.storage.search_logger import log_user_search, log_user_searches
 from backend.microservices.storage.bookmark_service import (
     add_bookmark,
     get_user_bookmarks,
@@ -36,16 +38,38 @@ from backend.microservices.storage.bookmark_service import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Load environment variables from .env file
-load_dotenv('../../.env')
+# Reuse the Supabase client shared with the storage modules
+supabase: Client = get_client()
 
-# Initialize Supabase client with environment variables
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")  # Using anon key for server-side operations
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Recently stored article URLs mapped to their IDs. News API results overlap
+# heavily between searches, so known URLs skip the database entirely.
+_url_cache = LRUCache(maxsize=10_000)
+_url_cache_lock = threading.Lock()
 
 logger.info("News Storage Service initialized with Supabase configuration")
 
+def _article_row(article):
+    """
+    Builds a news_articles row from an article as returned by the News API.
+    
+    Args:
+        article (dict): The article data, see store_article_in_supabase
+    
+    Returns:
+        dict: The column values to insert
+    """
+    source = article["source"]
+    return {
+        "title": article["title"],
+        "summary": article.get("summary", ""),
+        "content": article.get("content", ""),
+        # Handle source field which can be a dict (from API) or a plain string
+        "source": source["name"] if isinstance(source, dict) else source,
+        "published_at": article["publishedAt"],
+        "url": article["url"],
+        "image": article.get("urlToImage", "")
+    }
+
 def store_article_in_supabase(article):
     """
     Inserts a news article into the Supabase news_articles table if it doesn't already exist.
@@ -70,31 +94,85 @@ def store_article_in_supabase(article):
     """
     logger.debug(f"Attempting to store article: {article.get('title')} from {article.get('url')}")
     
+    with _url_cache_lock:
+        cached_id = _url_cache.get(article["url"])
+    if cached_id is not None:
+        return cached_id
+
     # Check if the article already exists using the URL as unique identifier
     try:
-        existing = supabase.table("news_articles").select("*").eq("url", article["url"]).execute()
+        existing = supabase.table("news_articles").select("id").eq("url", article["url"]).limit(1).execute()
         if existing.data and len(existing.data) > 0:
             # Article already exists; return its id
             logger.info(f"Article already exists with ID: {existing.data[0]['id']}")
+            with _url_cache_lock:
+                _url_cache[article["url"]] = existing.data[0]["id"]
             return existing.data[0]["id"]
         else:
             # Insert a new article with all available fields
             logger.debug("Article not found in database, proceeding with insertion")
-            result = supabase.table("news_articles").insert({
-                "title": article["title"],
-                "summary": article.get("summary", ""),
-                "content": article.get("content", ""),
-                # Handle source field which can be a dict (from API) or a plain string
-                "source": article["source"]["name"] if isinstance(article.get("source"), dict) else article["source"],
-                "published_at": article["publishedAt"],
-                "url": article["url"],
-                "image": article.get("urlToImage", "")
-            }).execute()
+            result = supabase.table("news_articles").insert(_article_row(article)).execute()
             logger.info(f"Successfully stored new article with ID: {result.data[0]['id']}")
+            with _url_cache_lock:
+                _url_cache[article["url"]] = result.data[0]["id"]
             return result.data[0]["id"]
     except Exception as e:
         logger.error(f"Error storing article in Supabase: {str(e)}")
         raise
 
+def store_articles_in_supabase(articles):
+    """
+    Stores a batch of news articles in the news_articles table with a single upsert.
+    
+    New articles are inserted in one request. Articles whose URL is already stored are
+    skipped by the UNIQUE constraint on the URL column rather than overwritten, so their
+    existing summary, content and image are kept; their IDs are then fetched with a single
+    lookup. Duplicate URLs within the batch are sent once and share the same ID, and URLs
+    stored recently by this process are resolved from memory without being sent at all.
+    
+    Args:
+        articles (list): A list of article dictionaries in the format accepted by
+            store_article_in_supabase
+    
+    Returns:
+        list: The article IDs, in the same order as the input articles
+    """
+    articles = list(articles)
+    if not articles:
+        return []
+
+    logger.debug(f"Attempting to store {len(articles)} articles")
+    try:
+        with _url_cache_lock:
+            ids_by_url = {article["url"]: _url_cache[article["url"]] for article in articles if article["url"] in _url_cache}
+
+        rows = {article["url"]: _article_row(article) for article in articles if article["url"] not in ids_by_url}
+
+        if rows:
+            # Existing rows are left untouched; only newly inserted rows come back
+            result = supabase.table("news_articles").upsert(
+                list(rows.values()), on_conflict="url", ignore_duplicates=True
+            ).execute()
+            stored = {row["url"]: row["id"] for row in result.data}
+            logger.info(f"Successfully inserted {len(stored)} new articles")
+
+            # Look up the IDs of the articles that were already stored
+            missing = [url for url in rows if url not in stored]
+            if missing:
+                existing = supabase.table("news_articles").select("id,url").in_("url", missing).execute()
+                stored.update({row["url"]: row["id"] for row in existing.data})
+                logger.debug(f"Resolved {len(existing.data)} existing articles")
+
+            with _url_cache_lock:
+                _url_cache.update(stored)
+            ids_by_url.update(stored)
+        else:
+            logger.debug("All articles already known, skipping upsert")
+
+        return [ids_by_url[article["url"]] for article in articles]
+    except Exception as e:
+        logger.error(f"Error storing articles in Supabase: {str(e)}")
+        raise
+
 # The functions log_user_search, add_bookmark, get_user_bookmarks, and delete_bookmark
 # have been moved to dedicated modules in the storage directory and are now imported above
\ No newline at end of file
@@ -14,23 +14,17 @@ Environment Variables Required:
 - VITE_SUPABASE_ANON_KEY: Supabase anonymous key for client operations
 """
 
-import os
 import datetime
 import logging
-from supabase import create_client, Client
-from dotenv import load_dotenv
+from supabase import Client
+from backend.microservices.storage.supabase_client import get_client
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Load environment variables from .env file
-load_dotenv('../../../.env')
-
-# Initialize Supabase client with environment variables
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")  # Using anon key for server-side operations
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Reuse the shared Supabase client and its connection pool
+supabase: Client = get_client()
 
 logger.info("Bookmark Service initialized with Supabase configuration")
 
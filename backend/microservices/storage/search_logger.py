@@ -13,23 +13,17 @@ Environment Variables Required:
 - VITE_SUPABASE_ANON_KEY: Supabase anonymous key for client operations
 """
 
-import os
 import datetime
 import logging
-from supabase import create_client, Client
-from dotenv import load_dotenv
+from supabase import Client
+from backend.microservices.storage.supabase_client import get_client
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Load environment variables from .env file
-load_dotenv('../../../.env')
-
-# Initialize Supabase client with environment variables
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")  # Using anon key for server-side operations
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Reuse the shared Supabase client and its connection pool
+supabase: Client = get_client()
 
 logger.info("Search Logger Service initialized with Supabase configuration")
 
@@ -51,7 +45,7 @@ def log_user_search(user_id, news_id, session_id):
     logger.info(f"Logging search event for user {user_id}, article {news_id}, session {session_id}")
     try:
         # Create a timestamp for when the search occurred
-        current_time = datetime.datetime.utcnow().isoformat()
+        current_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
         
         # Insert the search record with all required fields
         result = supabase.table("user_search_history").insert({
@@ -64,4 +58,40 @@ def log_user_search(user_id, news_id, session_id):
         return result
     except Exception as e:
         logger.error(f"Error logging search event: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+def log_user_searches(user_id, news_ids, session_id):
+    """
+    Logs search events for several articles with a single insert into user_search_history.
+    
+    This is the batched form of log_user_search, used when one search returns many articles.
+    All records share the same timestamp.
+    
+    Args:
+        user_id (str): The ID of the user performing the search
+        news_ids (list): The IDs of the news articles returned by the search
+        session_id (str): The current session identifier for tracking user activity
+    
+    Returns:
+        dict: The Supabase response object containing the result of the insert operation,
+              or None if there was nothing to log
+    """
+    if not news_ids:
+        return None
+    logger.info(f"Logging {len(news_ids)} search events for user {user_id}, session {session_id}")
+    try:
+        current_time = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        result = supabase.table("user_search_history").insert([
+            {
+                "user_id": user_id,
+                "news_id": news_id,
+                "searched_at": current_time,
+                "session_id": session_id,
+            }
+            for news_id in news_ids
+        ]).execute()
+        logger.debug(f"Search events logged successfully")
+        return result
+    except Exception as e:
+        logger.error(f"Error logging search events: {str(e)}")
+        raise e
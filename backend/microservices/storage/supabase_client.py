@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Supabase Client Module
+
+This module owns the Supabase client shared by the storage services. Each
+client wraps its own HTTP session, so reusing a single instance lets every
+caller share one pool of keep-alive connections instead of paying a fresh
+TCP/TLS handshake per module.
+
+Environment Variables Required:
+- VITE_SUPABASE_URL: Supabase project URL
+- VITE_SUPABASE_ANON_KEY: Supabase anonymous key for client operations
+"""
+
+import os
+import threading
+import logging
+from supabase import create_client, Client
+from dotenv import load_dotenv
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Load environment variables from .env file
+load_dotenv()
+
+SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
+SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")  # Using anon key for server-side operations
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client() -> Client:
+    """
+    Returns the process-wide Supabase client, creating it on first use.
+    
+    Returns:
+        Client: The shared Supabase client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+                logger.info("Shared Supabase client initialized")
+    return _client
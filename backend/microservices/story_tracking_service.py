@@ -29,6 +29,7 @@ Environment Variables Required:
 
 import os
 import datetime
+import logging
 from supabase import create_client, Client
 from dotenv import load_dotenv
 # from summarization.story_tracking.story_tracking import cluster_articles
@@ -50,26 +51,30 @@ from backend.microservices.story_tracking.story_manager import (
     update_all_tracked_stories
 )
 from backend.microservices.story_tracking.article_retriever import get_story_articles
+from backend.core.utils import setup_logger
+
+# Initialize logger
+logger = setup_logger(__name__)
 
 # Service initialization logging
-print("[DEBUG] [story_tracking_service] [main] Story tracking service starting...")
+logger.debug("Story tracking service starting...")
 
 # Load environment variables from .env file
 load_dotenv()
-print("[DEBUG] [story_tracking_service] [main] Environment variables loaded")
+logger.debug("Environment variables loaded")
 
 # Initialize Supabase client with service role key for admin access to bypass RLS
 # RLS (Row Level Security) policies are bypassed when using the service role key
 SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
-print(f"[DEBUG] [story_tracking_service] [main] Supabase URL: {SUPABASE_URL}")
-print(f"[DEBUG] [story_tracking_service] [main] Supabase Key: {SUPABASE_SERVICE_KEY[:5]}..." if SUPABASE_SERVICE_KEY else "[DEBUG] [story_tracking_service] [main] Supabase Key: None")
+logger.debug("Supabase URL: %s", SUPABASE_URL)
+logger.debug("Supabase Key: %s", f"{SUPABASE_SERVICE_KEY[:5]}..." if SUPABASE_SERVICE_KEY else None)
 
 # Create Supabase client for database operations
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 
-print("[DEBUG] [story_tracking_service] [main] Supabase client initialized")
+logger.debug("Supabase client initialized")
 
 def run_story_tracking(article_embeddings):
     """
@@ -86,7 +91,8 @@ def run_story_tracking(article_embeddings):
         list: A list of cluster labels indicating which story cluster each article belongs to.
               Empty list is returned if article_embeddings is None or empty.
     """
-    print(f"[DEBUG] [story_tracking_service] [run_story_tracking] Running story tracking with {len(article_embeddings) if article_embeddings else 0} embeddings")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running story tracking with %d embeddings", len(article_embeddings) if article_embeddings else 0)
     # Uncomment when clustering functionality is implemented
     # labels = cluster_articles(article_embeddings)
     # print(f"[DEBUG] [story_tracking_service] [run_story_tracking] Clustering complete, found {len(labels) if labels else 0} labels")
@@ -11,9 +11,9 @@ This module provides functionality for processing news articles, including:
 It integrates with Supabase for data persistence and OpenAI for text summarization.
 """
 
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from supabase import Client
+from backend.microservices.storage.supabase_client import get_client
 from backend.core.utils import setup_logger, log_exception
 from backend.microservices.summarization.content_fetcher import fetch_article_content
 from backend.microservices.summarization.keyword_extractor import get_keywords
@@ -25,16 +25,54 @@ from backend.microservices.summarization.summarization_utils import run_summariz
 # Initialize logger
 logger = setup_logger(__name__)
 
-# Load environment variables
-load_dotenv('../../.env')  # Optional: Only use this for local development
+# Reuse the shared Supabase client
+supabase: Client = get_client()
 
-# Initialize Supabase client
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Worker pool for per-article processing. Fetching an article's page is a
+# blocking HTTP request, so articles are processed concurrently.
+_article_pool = ThreadPoolExecutor(max_workers=8)
 
 logger.info("Article Processor Service initialized with Supabase configuration")
 
+def _summarize_article(article):
+    """
+    Fetches missing content for a single article, summarizes it and extracts keywords.
+    
+    Args:
+        article (dict): An article row from news_articles, with 'bookmarked_id' set.
+    
+    Returns:
+        dict: The processed article in the format returned by process_articles.
+    """
+    logger.info(f"Processing article: {article['title']}")
+    
+    content = article.get('content')
+    if not content:
+        logger.debug(f"No content found for article, fetching from URL: {article['url']}")
+        content = fetch_article_content(article['url'])
+    
+    if content:
+        logger.debug("Generating summary from fetched content")
+        summary = run_summarization(content)
+    else:
+        logger.debug("Generating summary from existing content")
+        summary = run_summarization(article.get('content', ''))
+    
+    logger.debug("Extracting keywords for filtering")
+    return {
+        'id': article['id'],
+        'title': article['title'],
+        'author': article.get('author', 'Unknown Author'),
+        'source': article.get('source'),
+        'publishedAt': article.get('published_at'),
+        'url': article['url'],
+        'urlToImage': article.get('image'),
+        'content': article.get('content', ''),
+        'summary': summary,
+        'filter_keywords': get_keywords(article.get('content', '')),
+        'bookmarked_id': article.get('bookmarked_id', None)
+    }
+
 @log_exception(logger)
 def process_articles(article_ids, user_id):
     """
@@ -46,6 +84,8 @@ def process_articles(article_ids, user_id):
     3. Generates summaries for each article.
     4. Extracts keywords for filtering.
     
+    Steps 2-4 run concurrently across articles.
+    
     Args:
         article_ids (list): A list of article IDs to process.
         user_id (str): The ID of the user for bookmark checking.
@@ -82,36 +122,8 @@ def process_articles(article_ids, user_id):
       
         logger.debug(f"Retrieved {len(articles)} articles for processing")
 
-        summarized_articles = []
-        for article in articles:
-            logger.info(f"Processing article: {article['title']}")
-            
-            content = article.get('content')
-            if not content:
-                logger.debug(f"No content found for article, fetching from URL: {article['url']}")
-                content = fetch_article_content(article['url'])
-            
-            if content:
-                logger.debug("Generating summary from fetched content")
-                summary = run_summarization(content)
-            else:
-                logger.debug("Generating summary from existing content")
-                summary = run_summarization(article.get('content', ''))
-            
-            logger.debug("Extracting keywords for filtering")
-            summarized_articles.append({
-                'id': article['id'],
-                'title': article['title'],
-                'author': article.get('author', 'Unknown Author'),
-                'source': article.get('source'),
-                'publishedAt': article.get('published_at'),
-                'url': article['url'],
-                'urlToImage': article.get('image'),
-                'content': article.get('content', ''),
-                'summary': summary,
-                'filter_keywords': get_keywords(article.get('content', '')),
-                'bookmarked_id': article.get('bookmarked_id', None)
-            })
+        # Process articles concurrently; map() keeps the database order
+        summarized_articles = list(_article_pool.map(_summarize_article, articles))
 
         logger.info(f"Successfully processed {len(summarized_articles)} articles")
         return summarized_articles
@@ -33,15 +33,11 @@ openai.api_key = Config.OPENAI_API_KEY
 
 # No need to instantiate a client object; we'll use openai.ChatCompletion.create directly.
 
-from supabase import create_client, Client  # Make sure you're using supabase-py or your preferred client
+from supabase import Client
+from backend.microservices.storage.supabase_client import get_client
 
-from dotenv import load_dotenv
-load_dotenv('../../.env')  # Optional: Only use this for local development.
-
-# Use your service key here for secure server-side operations.
-SUPABASE_URL = os.getenv("VITE_SUPABASE_URL")
-SUPABASE_SERVICE_KEY = os.getenv("VITE_SUPABASE_ANON_KEY")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+# Reuse the shared Supabase client and its connection pool
+supabase: Client = get_client()
 
 
 if __name__ == '__main__':
@@ -7,6 +7,12 @@ echo "Starting NewsFeast services..."
 echo "Starting polling worker..."
 python -m backend.microservices.polling_worker &
 
-# Start API gateway in the foreground
+# Start API gateway in the foreground under gunicorn with gevent workers so
+# concurrent requests overlap their Supabase/NewsAPI waits
 echo "Starting API gateway..."
-exec python backend/api_gateway/api_gateway.py
\ No newline at end of file
+exec gunicorn \
+    --worker-class gevent \
+    --workers "${GUNICORN_WORKERS:-$(nproc)}" \
+    --worker-connections "${GUNICORN_WORKER_CONNECTIONS:-1000}" \
+    --bind "0.0.0.0:${PORT:-8080}" \
+    backend.api_gateway.api_gateway:app
\ No newline at end of file
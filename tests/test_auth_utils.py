@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the JWT helpers in backend/api_gateway/utils/auth.py.
+
+decode_token verifies the signature with PyJWS and checks the claims itself,
+so these tests pin its behaviour to jwt.decode for the same tokens.
+"""
+
+import os
+import sys
+import time
+
+import jwt
+import pytest
+
+# Add project root to Python path for relative imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.api_gateway.utils.auth import _JWT_SECRET, decode_token
+
+NOW = int(time.time())
+
+PAYLOADS = {
+    'valid': {'sub': 'u1', 'aud': 'authenticated', 'iat': NOW, 'exp': NOW + 3600},
+    'expired': {'sub': 'u1', 'aud': 'authenticated', 'exp': NOW - 10},
+    'nbf_in_future': {'sub': 'u1', 'aud': 'authenticated', 'nbf': NOW + 3600},
+    'iat_in_future': {'sub': 'u1', 'aud': 'authenticated', 'iat': NOW + 3600},
+    'malformed_iat': {'sub': 'u1', 'aud': 'authenticated', 'iat': 'yesterday'},
+    'malformed_nbf': {'sub': 'u1', 'aud': 'authenticated', 'nbf': 'later'},
+    'malformed_exp': {'sub': 'u1', 'aud': 'authenticated', 'exp': 'soon'},
+    'numeric_string_exp': {'sub': 'u1', 'aud': 'authenticated', 'exp': str(NOW + 3600)},
+    'missing_aud': {'sub': 'u1', 'exp': NOW + 3600},
+    'wrong_aud': {'sub': 'u1', 'aud': 'anon'},
+    'list_aud': {'sub': 'u1', 'aud': ['anon', 'authenticated']},
+    'list_aud_without_match': {'sub': 'u1', 'aud': ['anon', 'service']},
+    'list_aud_with_non_string': {'sub': 'u1', 'aud': ['authenticated', 1]},
+    'non_list_aud': {'sub': 'u1', 'aud': 1},
+}
+
+def _outcome(decode, token):
+    try:
+        return decode(token)
+    except jwt.InvalidTokenError as e:
+        return type(e)
+
+@pytest.mark.parametrize('name', sorted(PAYLOADS))
+def test_decode_token_matches_jwt_decode(name):
+    token = jwt.encode(PAYLOADS[name], _JWT_SECRET, algorithm='HS256')
+    expected = _outcome(lambda t: jwt.decode(t, _JWT_SECRET, algorithms=['HS256'], audience='authenticated'), token)
+    assert _outcome(decode_token, token) == expected
+    # A second call may be served from the cache and must agree as well
+    assert _outcome(decode_token, token) == expected
+
+def test_decode_token_rejects_bad_signature():
+    token = jwt.encode(PAYLOADS['valid'], b'some-other-secret', algorithm='HS256')
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_token(token)
+
+def test_decode_token_rejects_other_algorithms():
+    token = jwt.encode(PAYLOADS['valid'], _JWT_SECRET, algorithm='HS512')
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        decode_token(token)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the News API cache in backend/microservices/data_services/news_fetcher.py.
+
+_request_news is stubbed, so these tests pin the caching and request
+coalescing done by fetch_news without calling the News API.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add project root to Python path for relative imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.microservices.data_services import news_fetcher
+
+ARTICLES = [{'title': 'A', 'url': 'https://example.com/a'}]
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Clear the cache and record the keywords sent to the News API."""
+    news_fetcher._news_cache.clear()
+    news_fetcher._inflight.clear()
+    calls = []
+
+    def fake_request_news(keyword):
+        calls.append(keyword)
+        return list(ARTICLES)
+
+    monkeypatch.setattr(news_fetcher, '_request_news', fake_request_news)
+    return calls
+
+def test_repeated_keyword_is_served_from_cache(requests_made):
+    assert news_fetcher.fetch_news(' Tech ') == ARTICLES
+    assert news_fetcher.fetch_news('tech') == ARTICLES
+    assert news_fetcher.fetch_news('TECH') == ARTICLES
+    assert requests_made == [' Tech ']
+
+def test_cached_list_is_not_shared_with_callers(requests_made):
+    news_fetcher.fetch_news('tech').append({'title': 'B', 'url': 'https://example.com/b'})
+    assert news_fetcher.fetch_news('tech') == ARTICLES
+
+def test_failed_request_is_not_cached(requests_made, monkeypatch):
+    results = iter([None, list(ARTICLES)])
+    monkeypatch.setattr(news_fetcher, '_request_news', lambda keyword: requests_made.append(keyword) or next(results))
+    assert news_fetcher.fetch_news('tech') is None
+    assert news_fetcher.fetch_news('tech') == ARTICLES
+    assert requests_made == ['tech', 'tech']
+    assert not news_fetcher._inflight
+
+def _run_concurrently(monkeypatch, request_news, callers=5):
+    """Call fetch_news('tech') from several threads while the first request is held open."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def held_request_news(keyword):
+        started.set()
+        release.wait(5)
+        return request_news(keyword)
+
+    monkeypatch.setattr(news_fetcher, '_request_news', held_request_news)
+    outcomes = [None] * callers
+
+    def call(i):
+        try:
+            outcomes[i] = news_fetcher.fetch_news('tech')
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=call, args=(0,))]
+    threads[0].start()
+    assert started.wait(5)
+    threads += [threading.Thread(target=call, args=(i,)) for i in range(1, callers)]
+    for thread in threads[1:]:
+        thread.start()
+    # Give the followers time to start waiting on the leader's request
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+def test_concurrent_callers_share_one_request(requests_made, monkeypatch):
+    def request_news(keyword):
+        requests_made.append(keyword)
+        return list(ARTICLES)
+
+    outcomes = _run_concurrently(monkeypatch, request_news)
+    assert requests_made == ['tech']
+    assert outcomes == [ARTICLES] * 5
+    # Every caller gets its own copy
+    assert len({id(o) for o in outcomes}) == 5
+    assert not news_fetcher._inflight
+
+def test_request_error_reaches_every_waiting_caller(requests_made, monkeypatch):
+    def request_news(keyword):
+        requests_made.append(keyword)
+        raise RuntimeError('upstream down')
+
+    outcomes = _run_concurrently(monkeypatch, request_news)
+    assert requests_made == ['tech']
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    assert not news_fetcher._inflight
+
+    # The failure is not cached, so the next call tries again
+    monkeypatch.setattr(news_fetcher, '_request_news', lambda keyword: requests_made.append(keyword) or list(ARTICLES))
+    assert news_fetcher.fetch_news('tech') == ARTICLES
+    assert requests_made == ['tech', 'tech']
+
+def test_request_news_drops_duplicate_and_missing_urls(monkeypatch):
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'status': 'ok', 'articles': [
+                {'title': 'A', 'url': 'https://example.com/a'},
+                {'title': 'No URL', 'url': None},
+                {'title': 'A again', 'url': 'https://example.com/a'},
+                {'title': 'B', 'url': 'https://example.com/b'},
+            ]}
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None):
+            return FakeResponse()
+
+    monkeypatch.setattr(news_fetcher, '_session', FakeSession())
+    assert [a['title'] for a in news_fetcher._request_news('tech')] == ['A', 'B']
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch article storage in backend/microservices/news_storage.py.
+
+The Supabase client is replaced with an in-memory stand-in for the
+news_articles table, so these tests pin how store_articles_in_supabase maps
+cached, newly inserted and already stored URLs back to the input order.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to Python path for relative imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.microservices.storage import supabase_client
+
+class FakeResult:
+    def __init__(self, data):
+        self.data = data
+
+class FakeQuery:
+    """Records one query against FakeTable and runs it on execute()."""
+
+    def __init__(self, table, action, payload=None, **options):
+        self.table = table
+        self.action = action
+        self.payload = payload
+        self.options = options
+        self.filters = []
+
+    def in_(self, column, values):
+        self.filters.append((column, list(values)))
+        return self
+
+    def execute(self):
+        self.table.queries.append(self)
+        if self.action == 'upsert':
+            assert self.options.get('on_conflict') == 'url'
+            inserted = []
+            for row in self.payload:
+                if row['url'] in self.table.rows:
+                    if not self.options.get('ignore_duplicates'):
+                        self.table.rows[row['url']].update(row)
+                    continue
+                stored = dict(row, id=f"id-{len(self.table.rows) + 1}")
+                self.table.rows[row['url']] = stored
+                inserted.append(dict(stored))
+            return FakeResult(inserted)
+        rows = list(self.table.rows.values())
+        for column, values in self.filters:
+            rows = [row for row in rows if row[column] in values]
+        return FakeResult([{'id': row['id'], 'url': row['url']} for row in rows])
+
+class FakeTable:
+    """In-memory news_articles table keyed by URL."""
+
+    def __init__(self):
+        self.rows = {}
+        self.queries = []
+
+    def upsert(self, rows, **options):
+        return FakeQuery(self, 'upsert', rows, **options)
+
+    def select(self, columns):
+        return FakeQuery(self, 'select')
+
+class FakeClient:
+    def __init__(self):
+        self.news_articles = FakeTable()
+
+    def table(self, name):
+        assert name == 'news_articles'
+        return self.news_articles
+
+# The storage modules fetch the shared client when imported
+if supabase_client._client is None:
+    supabase_client._client = FakeClient()
+
+from backend.microservices import news_storage
+
+def article(name, **fields):
+    return dict({
+        'title': name.upper(),
+        'source': {'id': None, 'name': 'Example'},
+        'publishedAt': '2024-01-01T00:00:00Z',
+        'url': f'https://example.com/{name}',
+    }, **fields)
+
+@pytest.fixture
+def table(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(news_storage, 'supabase', client)
+    news_storage._url_cache.clear()
+    yield client.news_articles
+    news_storage._url_cache.clear()
+
+def test_empty_batch_makes_no_requests(table):
+    assert news_storage.store_articles_in_supabase([]) == []
+    assert table.queries == []
+
+def test_ids_follow_input_order_across_cached_new_and_existing_urls(table):
+    table.rows['https://example.com/old'] = {'id': 'id-old', 'url': 'https://example.com/old'}
+    news_storage._url_cache['https://example.com/cached'] = 'id-cached'
+
+    ids = news_storage.store_articles_in_supabase([
+        article('new'), article('cached'), article('old'), article('new'),
+    ])
+
+    new_id = table.rows['https://example.com/new']['id']
+    assert ids == [new_id, 'id-cached', 'id-old', new_id]
+
+    upsert, lookup = table.queries
+    assert [row['url'] for row in upsert.payload] == ['https://example.com/new', 'https://example.com/old']
+    assert upsert.options['ignore_duplicates'] is True
+    assert lookup.filters == [('url', ['https://example.com/old'])]
+
+    assert news_storage._url_cache['https://example.com/new'] == new_id
+    assert news_storage._url_cache['https://example.com/old'] == 'id-old'
+
+def test_existing_rows_are_not_overwritten(table):
+    table.rows['https://example.com/old'] = {
+        'id': 'id-old', 'url': 'https://example.com/old', 'summary': 'Stored summary', 'image': 'stored.png',
+    }
+    assert news_storage.store_articles_in_supabase([article('old')]) == ['id-old']
+    assert table.rows['https://example.com/old']['summary'] == 'Stored summary'
+    assert table.rows['https://example.com/old']['image'] == 'stored.png'
+
+def test_only_new_urls_skip_the_lookup(table):
+    ids = news_storage.store_articles_in_supabase([article('a'), article('b')])
+    assert ids == [table.rows['https://example.com/a']['id'], table.rows['https://example.com/b']['id']]
+    assert [query.action for query in table.queries] == ['upsert']
+
+def test_fully_cached_batch_skips_the_database(table):
+    news_storage._url_cache['https://example.com/a'] = 'id-a'
+    news_storage._url_cache['https://example.com/b'] = 'id-b'
+    assert news_storage.store_articles_in_supabase([article('b'), article('a'), article('b')]) == ['id-b', 'id-a', 'id-b']
+    assert table.queries == []
+
+def test_source_may_be_a_plain_string(table):
+    news_storage.store_articles_in_supabase([article('a', source='Example Wire')])
+    assert table.rows['https://example.com/a']['source'] == 'Example Wire'